@@ -19,9 +19,9 @@ server.
 """
 
 # MCP Server Imports
-import json
 import sys
-from json import tool
+
+import orjson
 from mcp import types as mcp_types  # Use alias to avoid conflict
 from mcp.server.lowlevel import Server
 
@@ -37,7 +37,9 @@ from analytics_mcp.tools.admin.info import (
 )
 from analytics_mcp.tools.reporting.core import (
     run_report,
+    run_report_multi,
     _run_report_description,
+    _run_report_multi_description,
 )
 from analytics_mcp.tools.reporting.realtime import (
     run_realtime_report,
@@ -57,6 +59,8 @@ from analytics_mcp.tools.reporting.conversions import (
 
 run_report_with_description = FunctionTool(run_report)
 run_report_with_description.description = _run_report_description()
+run_report_multi_with_description = FunctionTool(run_report_multi)
+run_report_multi_with_description.description = _run_report_multi_description()
 run_realtime_report_with_description = FunctionTool(run_realtime_report)
 run_realtime_report_with_description.description = (
     _run_realtime_report_description()
@@ -78,6 +82,7 @@ tools = [
     FunctionTool(list_property_annotations),
     FunctionTool(get_custom_dimensions_and_metrics),
     run_report_with_description,
+    run_report_multi_with_description,
     run_realtime_report_with_description,
     run_funnel_report_with_description,
     run_conversions_report_with_description,
@@ -140,6 +145,13 @@ for tool in mcp_tools:
             "dimensions",
             "metrics",
         ]
+    elif tool.name == "run_report_multi":
+        tool.inputSchema["required"] = [
+            "property_ids",
+            "date_ranges",
+            "dimensions",
+            "metrics",
+        ]
     elif tool.name == "run_realtime_report":
         tool.inputSchema["required"] = ["property_id", "dimensions", "metrics"]
     elif tool.name == "run_conversions_report":
@@ -166,8 +178,12 @@ async def call_mcp_tool(name: str, arguments: dict) -> list[mcp_types.Content]:
                 args=arguments,
                 tool_context=None,
             )
-            # Serialize the ADK tool response to JSON for MCP response
-            response_text = json.dumps(adk_tool_response, indent=2)
+            # Serialize the ADK tool response to JSON for MCP response. Report
+            # responses can be large, so use orjson rather than the much
+            # slower stdlib encoder.
+            response_text = orjson.dumps(
+                adk_tool_response, option=orjson.OPT_INDENT_2
+            ).decode()
             # MCP expects a list of mcp_types.Content parts
             return [mcp_types.TextContent(type="text", text=response_text)]
 
@@ -177,12 +193,12 @@ async def call_mcp_tool(name: str, arguments: dict) -> list[mcp_types.Content]:
                 file=sys.stderr,
             )
             # Return an error message in MCP format
-            error_text = json.dumps(
+            error_text = orjson.dumps(
                 {"error": f"Failed to execute tool '{name}': {str(e)}"}
-            )
+            ).decode()
             return [mcp_types.TextContent(type="text", text=error_text)]
 
-    error_text = json.dumps(
+    error_text = orjson.dumps(
         {"error": f"Tool '{name}' not implemented by this server."}
-    )
+    ).decode()
     return [mcp_types.TextContent(type="text", text=error_text)]
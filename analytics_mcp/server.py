@@ -18,16 +18,18 @@
 
 import asyncio
 import sys
-import analytics_mcp.coordinator as coordinator
 from mcp.server.lowlevel import NotificationOptions
 from mcp.server.models import InitializationOptions
 import mcp.server.stdio
-import mcp.server
-import traceback
 
 
 async def run_server_async():
     """Runs the MCP server over standard I/O."""
+    # Imported here rather than at module scope so that importing this module
+    # doesn't load the tools along with the ADK and Google Analytics API
+    # packages they depend on.
+    import analytics_mcp.coordinator as coordinator
+
     print("Starting MCP Stdio Server:", coordinator.app.name, file=sys.stderr)
     async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
         await coordinator.app.run(
@@ -47,7 +49,12 @@ async def run_server_async():
 
 def run_server():
     """Synchronous wrapper to run the async MCP server."""
-    asyncio.run(run_server_async())
+    from analytics_mcp.tools.client import close_clients
+
+    try:
+        asyncio.run(run_server_async())
+    finally:
+        close_clients()
 
 
 if __name__ == "__main__":
@@ -15,12 +15,18 @@
 """Client initialization for the Google Analytics APIs."""
 
 import contextlib
+import datetime
+import math
+import os
 import subprocess
+import sys
 import threading
+import time
 from importlib import metadata
 from unittest.mock import patch
 
 import google.auth
+import google.auth.transport.requests
 from google.analytics import (
     admin_v1beta,
     data_v1beta,
@@ -37,7 +43,7 @@ def _get_package_version_with_fallback():
     """
     try:
         return metadata.version("analytics-mcp")
-    except:
+    except metadata.PackageNotFoundError:
         return "unknown"
 
 
@@ -51,9 +57,51 @@ _READ_ONLY_ANALYTICS_SCOPE = (
     "https://www.googleapis.com/auth/analytics.readonly"
 )
 
-# Lock to ensure client and credential creation is thread-safe
-_client_lock = threading.Lock()
+# Lock to ensure loading and refreshing credentials is thread-safe
+_credentials_lock = threading.Lock()
 _CREDENTIALS = None
+# Modification time of the GOOGLE_APPLICATION_CREDENTIALS file when the shared
+# credentials were loaded, used to reload them when the file is replaced.
+_credentials_file_mtime_ns = None
+# The file is checked at most this often so that tool calls don't each stat
+# it. `_credentials_file_check_after` is the monotonic time of the next check.
+_CREDENTIALS_FILE_CHECK_INTERVAL_SECONDS = 30
+_credentials_file_check_after = 0.0
+
+# Credentials that expire within this window are refreshed on a background
+# thread so that tool calls don't wait on the token endpoint.
+_BACKGROUND_REFRESH_WINDOW_SECONDS = 6 * 60
+# After a background refresh fails, or returns a token that still expires
+# within the window, wait this long before trying again.
+_BACKGROUND_REFRESH_RETRY_SECONDS = 30
+# Guards starting the background refresh thread. Separate from
+# _credentials_lock, which the thread holds during the token request.
+_background_refresh_lock = threading.Lock()
+_background_refresh_thread = None
+# Epoch time after which the shared credentials are due for a background
+# refresh. Computed once per load or refresh so the hot path is a single
+# float comparison.
+_refresh_after = 0.0
+# Epoch time until which the shared credentials can be used without checking
+# `credentials.valid`, which reads the clock through datetime on every call.
+# The margin is larger than the one google-auth uses to treat a token as
+# expired, so the fast path never returns a token it would consider expired.
+_EXPIRY_MARGIN_SECONDS = 4 * 60
+_valid_until = 0.0
+# Transport used for token refreshes. It wraps a requests.Session, so reusing
+# it keeps the connection to the token endpoint alive between refreshes.
+_refresh_request = None
+
+# API clients are shared across tool calls so that each call reuses the
+# client's gRPC channel instead of opening a new connection. Keyed by client
+# class.
+_client_lock = threading.Lock()
+_CLIENTS = {}
+# Clients dropped when the credentials were reloaded, paired with the
+# monotonic time after which they're closed. Calls in flight may still be
+# using them until then.
+_RETIRED_CLIENT_GRACE_SECONDS = 10 * 60
+_retired_clients = []
 
 
 @contextlib.contextmanager
@@ -75,46 +123,222 @@ def prevent_stdio_inheritance():
         yield
 
 
+def _update_refresh_deadline(credentials):
+    # Expected to be called under _credentials_lock
+    global _refresh_after, _valid_until
+    if credentials.expiry is None:
+        _refresh_after = math.inf
+        _valid_until = math.inf if credentials.valid else 0.0
+        return
+    # google-auth stores the expiry as a naive datetime in UTC.
+    expiry = credentials.expiry.replace(tzinfo=datetime.timezone.utc)
+    _refresh_after = expiry.timestamp() - _BACKGROUND_REFRESH_WINDOW_SECONDS
+    _valid_until = expiry.timestamp() - _EXPIRY_MARGIN_SECONDS
+
+
+def _refresh_credentials(credentials):
+    # Expected to be called under _credentials_lock
+    global _refresh_request
+    if _refresh_request is None:
+        _refresh_request = google.auth.transport.requests.Request()
+    with prevent_stdio_inheritance():
+        credentials.refresh(_refresh_request)
+    _update_refresh_deadline(credentials)
+
+
+def _background_refresh():
+    """Refreshes the shared credentials if they're still about to expire."""
+    global _refresh_after
+    with _credentials_lock:
+        if _CREDENTIALS is None:
+            return
+        # The credentials may have been refreshed by another path since the
+        # deadline was computed.
+        _update_refresh_deadline(_CREDENTIALS)
+        if time.time() < _refresh_after:
+            return
+        try:
+            _refresh_credentials(_CREDENTIALS)
+        except Exception as e:
+            # Tool calls fall back to refreshing inline once the token expires.
+            print(
+                f"Background credentials refresh failed: {e}", file=sys.stderr
+            )
+        # Back off if the refresh didn't move the expiry out of the window, so
+        # that tool calls don't start a new refresh each time. This happens
+        # when it fails, or when the source returns a cached token.
+        if time.time() >= _refresh_after:
+            _refresh_after = time.time() + _BACKGROUND_REFRESH_RETRY_SECONDS
+
+
+def _start_background_refresh():
+    """Starts a background refresh unless one is already running."""
+    global _background_refresh_thread
+    with _background_refresh_lock:
+        if (
+            _background_refresh_thread is not None
+            and _background_refresh_thread.is_alive()
+        ):
+            return
+        _background_refresh_thread = threading.Thread(
+            target=_background_refresh, daemon=True
+        )
+        _background_refresh_thread.start()
+
+
+def _get_credentials_file_mtime_ns():
+    """Returns the modification time of the GOOGLE_APPLICATION_CREDENTIALS file.
+
+    Returns None if the environment variable isn't set or the file can't be
+    read.
+    """
+    path = os.environ.get("GOOGLE_APPLICATION_CREDENTIALS")
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _get_credentials():
-    global _CREDENTIALS
+    """Returns the shared credentials, loading or refreshing them as needed.
+
+    Uses double-checked locking: callers skip the lock while the credentials
+    are valid, and concurrent callers that find them missing or expired wait
+    for a single load or token refresh instead of each starting their own.
+    Credentials that are still valid but about to expire are refreshed in the
+    background, so the caller gets the current token without waiting.
+
+    If the GOOGLE_APPLICATION_CREDENTIALS file changes, for example after
+    running `gcloud auth application-default login` again, the credentials
+    are reloaded from it. The file is checked at most every
+    `_CREDENTIALS_FILE_CHECK_INTERVAL_SECONDS`.
+    """
+    global _CREDENTIALS, _credentials_file_mtime_ns
+    global _credentials_file_check_after, _valid_until, _refresh_after
+    monotonic_now = time.monotonic()
+    file_unchanged = True
+    if monotonic_now >= _credentials_file_check_after:
+        _credentials_file_check_after = (
+            monotonic_now + _CREDENTIALS_FILE_CHECK_INTERVAL_SECONDS
+        )
+        file_unchanged = (
+            _get_credentials_file_mtime_ns() == _credentials_file_mtime_ns
+        )
+    credentials = _CREDENTIALS
+    now = time.time()
+    if credentials is not None and now < _valid_until and file_unchanged:
+        if now >= _refresh_after:
+            _start_background_refresh()
+        return credentials
+    with _credentials_lock:
+        # Stat the file again under the lock. A modification time read
+        # earlier may be older than the one recorded by a reload that ran
+        # while this thread waited, and must not trigger another reload.
+        mtime_ns = _get_credentials_file_mtime_ns()
+        credentials = _CREDENTIALS
+        if credentials is not None and mtime_ns != _credentials_file_mtime_ns:
+            # Drop the deadlines along with the credentials so that the fast
+            # path doesn't return the new credentials before they're ready.
+            _CREDENTIALS = None
+            _valid_until = _refresh_after = 0.0
+            credentials = None
+            # The shared clients hold the old credentials. Calls already in
+            # flight keep their client; new calls create one.
+            with _client_lock:
+                _retire_clients(_CLIENTS.values())
+                _CLIENTS.clear()
+        if credentials is None:
+            with prevent_stdio_inheritance():
+                credentials, _ = google.auth.default(
+                    scopes=[_READ_ONLY_ANALYTICS_SCOPE]
+                )
+            # Only publish the credentials once they have a token and their
+            # deadlines are set.
+            if not credentials.valid:
+                _refresh_credentials(credentials)
+            else:
+                _update_refresh_deadline(credentials)
+            _credentials_file_mtime_ns = mtime_ns
+            _CREDENTIALS = credentials
+        # Another thread may have refreshed the credentials while this one
+        # was waiting for the lock.
+        elif not credentials.valid:
+            _refresh_credentials(credentials)
+        else:
+            # The API clients can also refresh the credentials themselves, so
+            # the deadlines may be out of date.
+            _update_refresh_deadline(credentials)
+        return credentials
+
+
+def _retire_clients(clients):
     # Expected to be called under _client_lock
-    if _CREDENTIALS is None:
-        with prevent_stdio_inheritance():
-            _CREDENTIALS, _ = google.auth.default(
-                scopes=[_READ_ONLY_ANALYTICS_SCOPE]
-            )
-    return _CREDENTIALS
+    close_after = time.monotonic() + _RETIRED_CLIENT_GRACE_SECONDS
+    _retired_clients.extend((close_after, client) for client in clients)
+
+
+def _close_retired_clients():
+    """Closes the retired clients whose grace period has passed."""
+    with _client_lock:
+        now = time.monotonic()
+        while _retired_clients and _retired_clients[0][0] <= now:
+            _, client = _retired_clients.pop(0)
+            client.transport.close()
+
+
+def _get_client(client_class):
+    """Returns the shared instance of `client_class`, creating it if needed."""
+    if _retired_clients and time.monotonic() >= _retired_clients[0][0]:
+        _close_retired_clients()
+    credentials = _get_credentials()
+    client = _CLIENTS.get(client_class)
+    if client is None:
+        with _client_lock:
+            client = _CLIENTS.get(client_class)
+            if client is None:
+                client = client_class(
+                    client_info=_CLIENT_INFO, credentials=credentials
+                )
+                # If the credentials were reloaded since they were fetched,
+                # use the client for this call only so that later calls get
+                # one with the new credentials.
+                if credentials is _CREDENTIALS:
+                    _CLIENTS[client_class] = client
+                else:
+                    _retire_clients([client])
+    return client
+
+
+def close_clients():
+    """Closes the API clients and their underlying channels."""
+    with _client_lock:
+        for client in _CLIENTS.values():
+            client.transport.close()
+        for _, client in _retired_clients:
+            client.transport.close()
+        _CLIENTS.clear()
+        _retired_clients.clear()
 
 
 def create_admin_api_client() -> admin_v1beta.AnalyticsAdminServiceClient:
     """Returns the Google Analytics Admin API client."""
-    with _client_lock:
-        return admin_v1beta.AnalyticsAdminServiceClient(
-            client_info=_CLIENT_INFO, credentials=_get_credentials()
-        )
+    return _get_client(admin_v1beta.AnalyticsAdminServiceClient)
 
 
 def create_data_api_client() -> data_v1beta.BetaAnalyticsDataClient:
     """Returns the Google Analytics Data API client."""
-    with _client_lock:
-        return data_v1beta.BetaAnalyticsDataClient(
-            client_info=_CLIENT_INFO, credentials=_get_credentials()
-        )
+    return _get_client(data_v1beta.BetaAnalyticsDataClient)
 
 
 def create_admin_alpha_api_client() -> (
     admin_v1alpha.AnalyticsAdminServiceClient
 ):
     """Returns the Google Analytics Admin API (alpha) client."""
-    with _client_lock:
-        return admin_v1alpha.AnalyticsAdminServiceClient(
-            client_info=_CLIENT_INFO, credentials=_get_credentials()
-        )
+    return _get_client(admin_v1alpha.AnalyticsAdminServiceClient)
 
 
 def create_data_api_alpha_client() -> data_v1alpha.AlphaAnalyticsDataClient:
     """Returns the Google Analytics Data API (Alpha) client."""
-    with _client_lock:
-        return data_v1alpha.AlphaAnalyticsDataClient(
-            client_info=_CLIENT_INFO, credentials=_get_credentials()
-        )
+    return _get_client(data_v1alpha.AlphaAnalyticsDataClient)
@@ -151,6 +151,26 @@ async def run_conversions_report(
         currency_code: The currency code to use for currency values.
         return_property_quota: Whether to return property quota in the response.
     """
+    request_fields = {}
+    if dimension_filter:
+        request_fields["dimension_filter"] = data_v1alpha.FilterExpression(
+            dimension_filter
+        )
+    if metric_filter:
+        request_fields["metric_filter"] = data_v1alpha.FilterExpression(
+            metric_filter
+        )
+    if order_bys:
+        request_fields["order_bys"] = [
+            data_v1alpha.OrderBy(order_by) for order_by in order_bys
+        ]
+    if limit is not None:
+        request_fields["limit"] = limit
+    if offset is not None:
+        request_fields["offset"] = offset
+    if currency_code is not None:
+        request_fields["currency_code"] = currency_code
+
     request = data_v1alpha.RunReportRequest(
         property=construct_property_rn(property_id),
         dimensions=[
@@ -160,28 +180,9 @@ async def run_conversions_report(
         date_ranges=[data_v1alpha.DateRange(dr) for dr in date_ranges],
         conversion_spec=data_v1alpha.ConversionSpec(conversion_spec),
         return_property_quota=return_property_quota,
+        **request_fields,
     )
 
-    if dimension_filter:
-        request.dimension_filter = data_v1alpha.FilterExpression(
-            dimension_filter
-        )
-
-    if metric_filter:
-        request.metric_filter = data_v1alpha.FilterExpression(metric_filter)
-
-    if order_bys:
-        request.order_bys = [
-            data_v1alpha.OrderBy(order_by) for order_by in order_bys
-        ]
-
-    if limit:
-        request.limit = limit
-    if offset:
-        request.offset = offset
-    if currency_code:
-        request.currency_code = currency_code
-
     def _sync_call():
         return create_data_api_alpha_client().run_report(request)
 
@@ -24,12 +24,62 @@ from analytics_mcp.tools.reporting.metadata import (
     get_order_bys_hints,
 )
 from analytics_mcp.tools.utils import (
+    construct_dimension,
+    construct_metric,
     construct_property_rn,
     proto_to_dict,
 )
 from analytics_mcp.tools.client import create_data_api_client
 from google.analytics import data_v1beta
 
+# Maximum number of reports `run_report_multi` runs at once, so that a fan-out
+# over many properties stays within the Data API's concurrent request quotas.
+_MAX_CONCURRENT_REPORTS = 10
+
+
+def _run_report_request_fields(
+    date_ranges: List[Dict[str, Any]],
+    dimensions: List[str],
+    metrics: List[str],
+    dimension_filter: Dict[str, Any],
+    metric_filter: Dict[str, Any],
+    order_bys: List[Dict[str, Any]],
+    limit: int,
+    offset: int,
+    currency_code: str,
+    return_property_quota: bool,
+) -> Dict[str, Any]:
+    """Returns the `RunReportRequest` fields other than `property`."""
+    # Collect the optional fields first so the request is built in a single
+    # constructor call instead of being modified field by field afterwards.
+    request_fields = {}
+    if dimension_filter:
+        request_fields["dimension_filter"] = data_v1beta.FilterExpression(
+            dimension_filter
+        )
+    if metric_filter:
+        request_fields["metric_filter"] = data_v1beta.FilterExpression(
+            metric_filter
+        )
+    if order_bys:
+        request_fields["order_bys"] = [
+            data_v1beta.OrderBy(order_by) for order_by in order_bys
+        ]
+    if limit is not None:
+        request_fields["limit"] = limit
+    if offset is not None:
+        request_fields["offset"] = offset
+    if currency_code is not None:
+        request_fields["currency_code"] = currency_code
+
+    return dict(
+        dimensions=[construct_dimension(dimension) for dimension in dimensions],
+        metrics=[construct_metric(metric) for metric in metrics],
+        date_ranges=[data_v1beta.DateRange(dr) for dr in date_ranges],
+        return_property_quota=return_property_quota,
+        **request_fields,
+    )
+
 
 def _run_report_description() -> str:
     """Returns the description for the `run_report` tool."""
@@ -79,6 +129,20 @@ def _run_report_description() -> str:
           """
 
 
+def _run_report_multi_description() -> str:
+    """Returns the description for the `run_report_multi` tool."""
+    # The argument hints are the same as for `run_report`. They aren't
+    # repeated, since every tool description is sent to the model.
+    return f"""
+          {run_report_multi.__doc__}
+
+          ## Hints for arguments
+
+          The arguments other than `property_ids` follow the hints in the
+          description of the `run_report` tool.
+          """
+
+
 async def run_report(
     property_id: int | str,
     date_ranges: List[Dict[str, Any]],
@@ -140,37 +204,126 @@ async def run_report(
     """
     request = data_v1beta.RunReportRequest(
         property=construct_property_rn(property_id),
-        dimensions=[
-            data_v1beta.Dimension(name=dimension) for dimension in dimensions
-        ],
-        metrics=[data_v1beta.Metric(name=metric) for metric in metrics],
-        date_ranges=[data_v1beta.DateRange(dr) for dr in date_ranges],
-        return_property_quota=return_property_quota,
+        **_run_report_request_fields(
+            date_ranges,
+            dimensions,
+            metrics,
+            dimension_filter,
+            metric_filter,
+            order_bys,
+            limit,
+            offset,
+            currency_code,
+            return_property_quota,
+        ),
     )
 
-    if dimension_filter:
-        request.dimension_filter = data_v1beta.FilterExpression(
-            dimension_filter
-        )
+    def _sync_call():
+        return create_data_api_client().run_report(request)
 
-    if metric_filter:
-        request.metric_filter = data_v1beta.FilterExpression(metric_filter)
+    response = await asyncio.to_thread(_sync_call)
 
-    if order_bys:
-        request.order_bys = [
-            data_v1beta.OrderBy(order_by) for order_by in order_bys
-        ]
+    return proto_to_dict(response)
 
-    if limit:
-        request.limit = limit
-    if offset:
-        request.offset = offset
-    if currency_code:
-        request.currency_code = currency_code
 
-    def _sync_call():
+async def run_report_multi(
+    property_ids: List[int | str],
+    date_ranges: List[Dict[str, Any]],
+    dimensions: List[str],
+    metrics: List[str],
+    dimension_filter: Dict[str, Any] = None,
+    metric_filter: Dict[str, Any] = None,
+    order_bys: List[Dict[str, Any]] = None,
+    limit: int = None,
+    offset: int = None,
+    currency_code: str = None,
+    return_property_quota: bool = False,
+) -> Dict[str, Dict[str, Any]]:
+    """Runs the same Google Analytics Data API report for several properties.
+
+    Use this instead of calling `run_report` once per property when comparing
+    properties. Up to 10 reports run concurrently.
+
+    Args:
+        property_ids: The Google Analytics property IDs to run the report
+          for. Accepted formats for each ID are:
+          - A number
+          - A string consisting of 'properties/' followed by a number
+        date_ranges: A list of date ranges
+          (https://developers.google.com/analytics/devguides/reporting/data/v1/rest/v1beta/DateRange)
+          to include in each report.
+        dimensions: A list of dimensions to include in each report. Custom
+          dimensions must exist in every property.
+        metrics: A list of metrics to include in each report. Custom metrics
+          must exist in every property.
+        dimension_filter: A Data API FilterExpression
+          (https://developers.google.com/analytics/devguides/reporting/data/v1/rest/v1beta/FilterExpression)
+          to apply to the dimensions, as in `run_report`.
+        metric_filter: A Data API FilterExpression
+          (https://developers.google.com/analytics/devguides/reporting/data/v1/rest/v1beta/FilterExpression)
+          to apply to the metrics, as in `run_report`.
+        order_bys: A list of Data API OrderBy
+          (https://developers.google.com/analytics/devguides/reporting/data/v1/rest/v1beta/OrderBy)
+          objects to apply to the dimensions and metrics.
+        limit: The maximum number of rows to return in each response, as in
+          `run_report`.
+        offset: The row count of the start row in each response, as in
+          `run_report`.
+        currency_code: The currency code to use for currency values, as in
+          `run_report`.
+        return_property_quota: Whether to return property quota in each
+          response.
+
+    Returns:
+        A dictionary mapping each property resource name, such as
+        'properties/1234', to its report. If the report for a property fails,
+        its entry is a dictionary with an `error` key describing the failure
+        instead, and the reports for the other properties are still returned.
+    """
+    # The request fields are built once and copied into each property's
+    # request.
+    request_fields = _run_report_request_fields(
+        date_ranges,
+        dimensions,
+        metrics,
+        dimension_filter,
+        metric_filter,
+        order_bys,
+        limit,
+        offset,
+        currency_code,
+        return_property_quota,
+    )
+    requests = {}
+    for property_id in property_ids:
+        property_rn = construct_property_rn(property_id)
+        requests[property_rn] = data_v1beta.RunReportRequest(
+            property=property_rn, **request_fields
+        )
+
+    def _sync_call(request):
         return create_data_api_client().run_report(request)
 
-    response = await asyncio.to_thread(_sync_call)
+    # Each report starts as soon as a slot frees up, rather than in fixed
+    # batches.
+    semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REPORTS)
 
-    return proto_to_dict(response)
+    async def _run(request):
+        async with semaphore:
+            return await asyncio.to_thread(_sync_call, request)
+
+    responses = await asyncio.gather(
+        *(_run(request) for request in requests.values()),
+        return_exceptions=True,
+    )
+
+    results = {}
+    for property_rn, response in zip(requests, responses):
+        if isinstance(response, Exception):
+            results[property_rn] = {"error": str(response)}
+        elif isinstance(response, BaseException):
+            # Cancellation isn't a per-property failure.
+            raise response
+        else:
+            results[property_rn] = proto_to_dict(response)
+    return results
@@ -15,6 +15,7 @@
 """Tools for running funnel reports using the Data API (Alpha)."""
 
 import asyncio
+import functools
 from typing import Any, Dict, List
 
 from analytics_mcp.tools.reporting.metadata import (
@@ -29,6 +30,12 @@ from analytics_mcp.tools.client import create_data_api_alpha_client
 from google.analytics import data_v1alpha
 
 
+@functools.lru_cache(maxsize=64)
+def _dimension(name: str) -> data_v1alpha.Dimension:
+    """Returns a `Dimension` for `name`, like `construct_dimension` in utils."""
+    return data_v1alpha.Dimension(name=name)
+
+
 def _run_funnel_report_description() -> str:
     """Returns the description for the `run_funnel_report` tool."""
     return f"""
@@ -141,16 +148,19 @@ async def run_funnel_report(
         if not isinstance(step, dict):
             raise ValueError(f"Step {i+1} must be a dictionary")
 
-        step_name = step.get("name", f"Step {i+1}")
+        # Only format the default name when the step doesn't have one.
+        step_name = step.get("name")
+        if step_name is None:
+            step_name = f"Step {i+1}"
 
-        if "filter_expression" in step:
-            filter_expr = data_v1alpha.FunnelFilterExpression(
-                step["filter_expression"]
-            )
-        elif "event" in step:
+        filter_expression = step.get("filter_expression")
+        event = step.get("event")
+        if filter_expression is not None:
+            filter_expr = data_v1alpha.FunnelFilterExpression(filter_expression)
+        elif event is not None:
             filter_expr = data_v1alpha.FunnelFilterExpression(
                 funnel_event_filter=data_v1alpha.FunnelEventFilter(
-                    event_name=step["event"]
+                    event_name=event
                 )
             )
         else:
@@ -163,35 +173,33 @@ async def run_funnel_report(
         )
         steps.append(funnel_step)
 
-    request = data_v1alpha.RunFunnelReportRequest(
-        property=construct_property_rn(property_id),
-        funnel=data_v1alpha.Funnel(steps=steps),
-        date_ranges=[data_v1alpha.DateRange(dr) for dr in (date_ranges or [])],
-        return_property_quota=return_property_quota,
-    )
-
+    request_fields = {}
     if funnel_breakdown and "breakdown_dimension" in funnel_breakdown:
-        request.funnel_breakdown = data_v1alpha.FunnelBreakdown(
-            breakdown_dimension=data_v1alpha.Dimension(
-                name=funnel_breakdown["breakdown_dimension"]
+        request_fields["funnel_breakdown"] = data_v1alpha.FunnelBreakdown(
+            breakdown_dimension=_dimension(
+                funnel_breakdown["breakdown_dimension"]
             )
         )
-
     if funnel_next_action and "next_action_dimension" in funnel_next_action:
-        next_action_config = data_v1alpha.FunnelNextAction(
-            next_action_dimension=data_v1alpha.Dimension(
-                name=funnel_next_action["next_action_dimension"]
-            )
+        request_fields["funnel_next_action"] = data_v1alpha.FunnelNextAction(
+            next_action_dimension=_dimension(
+                funnel_next_action["next_action_dimension"]
+            ),
+            limit=funnel_next_action.get("limit"),
         )
-        if "limit" in funnel_next_action:
-            next_action_config.limit = funnel_next_action["limit"]
-        request.funnel_next_action = next_action_config
-
     if segments:
-        request.segments = [
+        request_fields["segments"] = [
             data_v1alpha.Segment(segment) for segment in segments
         ]
 
+    request = data_v1alpha.RunFunnelReportRequest(
+        property=construct_property_rn(property_id),
+        funnel=data_v1alpha.Funnel(steps=steps),
+        date_ranges=[data_v1alpha.DateRange(dr) for dr in (date_ranges or [])],
+        return_property_quota=return_property_quota,
+        **request_fields,
+    )
+
     def _sync_call():
         return create_data_api_alpha_client().run_funnel_report(request)
 
@@ -15,6 +15,7 @@
 """Metadata to provide context and hints for reporting tools."""
 
 import asyncio
+import functools
 from typing import Any, Dict, List
 
 from analytics_mcp.tools.utils import (
@@ -26,6 +27,7 @@ from analytics_mcp.tools.client import create_data_api_client
 from google.analytics import data_v1alpha, data_v1beta
 
 
+@functools.cache
 def get_date_ranges_hints():
     range_jan = data_v1beta.DateRange(
         start_date="2025-01-01", end_date="2025-01-31", name="Jan2025"
@@ -56,6 +58,7 @@ def get_date_ranges_hints():
     """
 
 
+@functools.cache
 def get_funnel_steps_hints():
     """Returns hints and examples for funnel steps configuration."""
     step_first_open = data_v1alpha.FunnelStep(
@@ -281,6 +284,7 @@ _FILTER_NOTES = """
   """
 
 
+@functools.cache
 def get_metric_filter_hints():
     """Returns hints and samples for metric_filter arguments."""
     event_count_gt_10_filter = data_v1beta.FilterExpression(
@@ -339,6 +343,7 @@ def get_metric_filter_hints():
     """ + _FILTER_NOTES
 
 
+@functools.cache
 def get_dimension_filter_hints():
     """Returns hints and samples for dimension_filter arguments."""
     begins_with = data_v1beta.FilterExpression(
@@ -403,6 +408,7 @@ def get_dimension_filter_hints():
     """ + _FILTER_NOTES
 
 
+@functools.cache
 def get_order_bys_hints():
     """Returns hints and examples for order_bys arguments."""
     dimension_alphanumeric_ascending = data_v1beta.OrderBy(
@@ -15,9 +15,12 @@
 """Tools for running realtime reports using the Data API."""
 
 import asyncio
+import time
 from typing import Any, Dict, List
 
 from analytics_mcp.tools.utils import (
+    construct_dimension,
+    construct_metric,
     construct_property_rn,
     proto_to_dict,
 )
@@ -30,6 +33,32 @@ from analytics_mcp.tools.reporting.metadata import (
 )
 from google.analytics import data_v1beta
 
+# Realtime reports are cached briefly so that repeating a query, for example
+# to refresh a dashboard, doesn't use up the property's realtime quota. Maps
+# each serialized request to the monotonic time its response expires and the
+# response.
+_REALTIME_CACHE_TTL_SECONDS = 10
+_REALTIME_CACHE_MAX_SIZE = 128
+_realtime_cache = {}
+
+
+def _cache_realtime_result(
+    key: bytes, response: data_v1beta.RunRealtimeReportResponse, now: float
+):
+    """Caches `response`, evicting expired and then the oldest entries if full."""
+    _realtime_cache.pop(key, None)
+    if len(_realtime_cache) >= _REALTIME_CACHE_MAX_SIZE:
+        expired = [
+            cached_key
+            for cached_key, (expires_at, _) in _realtime_cache.items()
+            if expires_at <= now
+        ]
+        for cached_key in expired:
+            del _realtime_cache[cached_key]
+        while len(_realtime_cache) >= _REALTIME_CACHE_MAX_SIZE:
+            del _realtime_cache[next(iter(_realtime_cache))]
+    _realtime_cache[key] = (now + _REALTIME_CACHE_TTL_SECONDS, response)
+
 
 def _run_realtime_report_description() -> str:
     """Returns the description for the `run_realtime_report` tool."""
@@ -94,6 +123,10 @@ async def run_realtime_report(
     https://developers.google.com/analytics/devguides/reporting/data/v1/realtime-basics
     for more information.
 
+    Identical reports run within 10 seconds of each other return the same
+    rows. Reports that set `return_property_quota` aren't cached, so the quota
+    they return is always current.
+
     Args:
         property_id: The Google Analytics property ID. Accepted formats are:
           - A number
@@ -131,35 +164,46 @@ async def run_realtime_report(
           https://developers.google.com/analytics/devguides/reporting/data/v1/basics#pagination.
         return_property_quota: Whether to return realtime property quota in the response.
     """
-    request = data_v1beta.RunRealtimeReportRequest(
-        property=construct_property_rn(property_id),
-        dimensions=[
-            data_v1beta.Dimension(name=dimension) for dimension in dimensions
-        ],
-        metrics=[data_v1beta.Metric(name=metric) for metric in metrics],
-        return_property_quota=return_property_quota,
-    )
-
+    request_fields = {}
     if dimension_filter:
-        request.dimension_filter = data_v1beta.FilterExpression(
+        request_fields["dimension_filter"] = data_v1beta.FilterExpression(
             dimension_filter
         )
-
     if metric_filter:
-        request.metric_filter = data_v1beta.FilterExpression(metric_filter)
-
+        request_fields["metric_filter"] = data_v1beta.FilterExpression(
+            metric_filter
+        )
     if order_bys:
-        request.order_bys = [
+        request_fields["order_bys"] = [
             data_v1beta.OrderBy(order_by) for order_by in order_bys
         ]
-
     if limit:
-        request.limit = limit
+        request_fields["limit"] = limit
     if offset:
-        request.offset = offset
+        request_fields["offset"] = offset
+
+    request = data_v1beta.RunRealtimeReportRequest(
+        property=construct_property_rn(property_id),
+        dimensions=[construct_dimension(dimension) for dimension in dimensions],
+        metrics=[construct_metric(metric) for metric in metrics],
+        return_property_quota=return_property_quota,
+        **request_fields,
+    )
 
     def _sync_call():
         return create_data_api_client().run_realtime_report(request)
 
+    if return_property_quota:
+        return proto_to_dict(await asyncio.to_thread(_sync_call))
+
+    # The response is cached rather than the dict built from it, so that each
+    # caller gets its own dict and can't change what later callers see.
+    cache_key = data_v1beta.RunRealtimeReportRequest.serialize(request)
+    now = time.monotonic()
+    cached = _realtime_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return proto_to_dict(cached[1])
+
     response = await asyncio.to_thread(_sync_call)
+    _cache_realtime_result(cache_key, response, now)
     return proto_to_dict(response)
@@ -14,13 +14,28 @@
 
 """Common utilities used by the MCP server."""
 
+import functools
 from typing import Any, Dict
 
 import proto
+from google.analytics import data_v1beta
 
 
 def construct_property_rn(property_value: int | str) -> str:
-    """Returns a property resource name in the format required by APIs."""
+    """Returns a property resource name in the format required by APIs.
+
+    Results are cached, since the tool calls in a session tend to reuse the
+    same few properties.
+    """
+    if not isinstance(property_value, (int, str)):
+        # Other types are never valid and may not be hashable, so skip the
+        # cache and let the parser reject them.
+        return _construct_property_rn.__wrapped__(property_value)
+    return _construct_property_rn(property_value)
+
+
+@functools.lru_cache(maxsize=128, typed=True)
+def _construct_property_rn(property_value: int | str) -> str:
     property_num = None
     if isinstance(property_value, int):
         property_num = property_value
@@ -44,6 +59,21 @@ def construct_property_rn(property_value: int | str) -> str:
     return f"properties/{property_num}"
 
 
+# Requests copy a message when it's added to them, so the cached `Dimension`
+# and `Metric` instances below are shared across requests without ever being
+# modified.
+@functools.lru_cache(maxsize=512)
+def construct_dimension(name: str) -> data_v1beta.Dimension:
+    """Returns a `Dimension` for `name`, shared across requests."""
+    return data_v1beta.Dimension(name=name)
+
+
+@functools.lru_cache(maxsize=512)
+def construct_metric(name: str) -> data_v1beta.Metric:
+    """Returns a `Metric` for `name`, shared across requests."""
+    return data_v1beta.Metric(name=name)
+
+
 def proto_to_dict(obj: proto.Message) -> Dict[str, Any]:
     """Converts a proto message to a dictionary."""
     return type(obj).to_dict(
@@ -0,0 +1,354 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the client module."""
+
+import datetime
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from analytics_mcp.tools import client
+
+
+class TestClient(unittest.TestCase):
+    """Test cases for the client module."""
+
+    def setUp(self):
+        super().setUp()
+        client._CREDENTIALS = None
+        client._background_refresh_thread = None
+        client._refresh_after = 0.0
+        client._valid_until = 0.0
+        client._credentials_file_mtime_ns = None
+        client._credentials_file_check_after = 0.0
+        self.addCleanup(setattr, client, "_CREDENTIALS", None)
+
+    def _patch_credentials_file(self):
+        """Points GOOGLE_APPLICATION_CREDENTIALS at a temporary file."""
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+        patcher = mock.patch.dict(
+            os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": path}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        return path
+
+    def _patch_default(self, credentials):
+        patcher = mock.patch.object(
+            client.google.auth,
+            "default",
+            return_value=(credentials, "project"),
+        )
+        self.addCleanup(patcher.stop)
+        return patcher.start()
+
+    def test_get_credentials_loads_once(self):
+        """Tests that valid credentials are loaded once and then reused."""
+        credentials = mock.Mock(valid=True, expiry=None)
+        default = self._patch_default(credentials)
+
+        self.assertIs(client._get_credentials(), credentials)
+        self.assertIs(client._get_credentials(), credentials)
+        default.assert_called_once()
+        credentials.refresh.assert_not_called()
+
+    def test_get_credentials_skips_validity_check_before_expiry(self):
+        """Tests that loaded credentials far from expiry aren't rechecked."""
+        expiry = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        ) + datetime.timedelta(hours=1)
+        credentials = mock.Mock(expiry=expiry)
+        valid = mock.PropertyMock(return_value=True)
+        type(credentials).valid = valid
+        self._patch_default(credentials)
+        client._get_credentials()
+        valid.reset_mock()
+
+        self.assertIs(client._get_credentials(), credentials)
+        valid.assert_not_called()
+
+    def test_get_credentials_refreshes_invalid_credentials(self):
+        """Tests that invalid credentials are refreshed before being returned."""
+        credentials = mock.Mock(valid=False, expiry=None)
+
+        def refresh(request):
+            credentials.valid = True
+
+        credentials.refresh.side_effect = refresh
+        self._patch_default(credentials)
+
+        self.assertIs(client._get_credentials(), credentials)
+        self.assertIs(client._get_credentials(), credentials)
+        credentials.refresh.assert_called_once()
+
+    def test_refresh_reuses_transport(self):
+        """Tests that token refreshes share a single transport."""
+        credentials = mock.Mock(expiry=None)
+        self.addCleanup(setattr, client, "_refresh_request", None)
+
+        client._refresh_credentials(credentials)
+        client._refresh_credentials(credentials)
+
+        first_request = credentials.refresh.call_args_list[0].args[0]
+        second_request = credentials.refresh.call_args_list[1].args[0]
+        self.assertIs(first_request, second_request)
+
+    def test_get_credentials_refreshes_expiring_credentials_in_background(
+        self,
+    ):
+        """Tests that credentials close to expiry are refreshed in the background."""
+        expiry = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        ) + datetime.timedelta(minutes=5)
+        credentials = mock.Mock(valid=True, expiry=expiry)
+
+        def refresh(request):
+            credentials.expiry = expiry + datetime.timedelta(hours=1)
+
+        credentials.refresh.side_effect = refresh
+        self._patch_default(credentials)
+        client._get_credentials()
+        credentials.refresh.assert_not_called()
+
+        self.assertIs(client._get_credentials(), credentials)
+        client._background_refresh_thread.join()
+        credentials.refresh.assert_called_once()
+
+        # The refreshed credentials no longer need a background refresh.
+        client._get_credentials()
+        credentials.refresh.assert_called_once()
+
+    def test_get_credentials_doesnt_wait_for_background_refresh(self):
+        """Tests that callers get the current token during a slow refresh."""
+        expiry = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        ) + datetime.timedelta(minutes=5)
+        credentials = mock.Mock(valid=True, expiry=expiry)
+        refresh_started = threading.Event()
+        finish_refresh = threading.Event()
+
+        def refresh(request):
+            refresh_started.set()
+            finish_refresh.wait()
+
+        credentials.refresh.side_effect = refresh
+        self._patch_default(credentials)
+        client._get_credentials()
+        client._get_credentials()
+        self.addCleanup(client._background_refresh_thread.join)
+        self.addCleanup(finish_refresh.set)
+        self.assertTrue(refresh_started.wait(timeout=5))
+
+        caller = threading.Thread(target=client._get_credentials)
+        caller.start()
+        caller.join(timeout=1)
+        self.assertFalse(caller.is_alive())
+        credentials.refresh.assert_called_once()
+
+    def test_background_refresh_backs_off_after_failure(self):
+        """Tests that a failed background refresh isn't retried right away."""
+        expiry = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        ) + datetime.timedelta(minutes=5)
+        credentials = mock.Mock(valid=True, expiry=expiry)
+        credentials.refresh.side_effect = Exception("token endpoint down")
+        self._patch_default(credentials)
+        client._get_credentials()
+
+        with mock.patch("sys.stderr"):
+            client._get_credentials()
+            client._background_refresh_thread.join()
+        self.assertGreater(client._refresh_after, time.time())
+
+        client._get_credentials()
+        client._background_refresh_thread.join()
+        credentials.refresh.assert_called_once()
+
+    def test_background_refresh_backs_off_when_expiry_unchanged(self):
+        """Tests that a refresh returning the same token isn't retried."""
+        expiry = datetime.datetime.now(datetime.timezone.utc).replace(
+            tzinfo=None
+        ) + datetime.timedelta(minutes=5)
+        credentials = mock.Mock(valid=True, expiry=expiry)
+        self._patch_default(credentials)
+        client._get_credentials()
+
+        client._get_credentials()
+        client._background_refresh_thread.join()
+        self.assertGreater(client._refresh_after, time.time())
+
+        client._get_credentials()
+        client._background_refresh_thread.join()
+        credentials.refresh.assert_called_once()
+
+    def test_create_client_reuses_client(self):
+        """Tests that API clients are created once and shared."""
+        self._patch_default(mock.Mock(valid=True, expiry=None))
+        client_class = mock.Mock(side_effect=lambda **kwargs: mock.Mock())
+        self.addCleanup(client._CLIENTS.clear)
+
+        first = client._get_client(client_class)
+        second = client._get_client(client_class)
+
+        self.assertIs(first, second)
+        client_class.assert_called_once()
+
+        # Closing the clients means the next call creates a new one.
+        client.close_clients()
+        first.transport.close.assert_called_once()
+        self.assertIsNot(client._get_client(client_class), first)
+
+    def test_get_client_doesnt_share_client_with_reloaded_credentials(self):
+        """Tests that a client built with replaced credentials isn't shared."""
+        self._patch_default(mock.Mock(valid=True, expiry=None))
+        self.addCleanup(client._CLIENTS.clear)
+        self.addCleanup(client._retired_clients.clear)
+
+        def reload_and_create(**kwargs):
+            # Simulates another thread reloading the credentials while this
+            # client is being created.
+            client._CREDENTIALS = mock.Mock(valid=True, expiry=None)
+            return mock.Mock()
+
+        client_class = mock.Mock(side_effect=reload_and_create)
+        stale = client._get_client(client_class)
+
+        self.assertNotIn(client_class, client._CLIENTS)
+        client.close_clients()
+        stale.transport.close.assert_called_once()
+
+    def test_get_credentials_waits_for_reloaded_credentials_token(self):
+        """Tests that reloaded credentials aren't returned before a refresh."""
+        path = self._patch_credentials_file()
+        old = mock.Mock(valid=True, expiry=None)
+        new = mock.Mock(valid=False, expiry=None)
+        default = self._patch_default(old)
+        client._get_credentials()
+
+        refresh_started = threading.Event()
+        finish_refresh = threading.Event()
+
+        def refresh(request):
+            refresh_started.set()
+            finish_refresh.wait()
+            new.valid = True
+
+        new.refresh.side_effect = refresh
+        default.return_value = (new, "project")
+        self.addCleanup(finish_refresh.set)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        client._credentials_file_check_after = 0.0
+
+        results = []
+        callers = [
+            threading.Thread(
+                target=lambda: results.append(client._get_credentials())
+            )
+            for _ in range(2)
+        ]
+        callers[0].start()
+        self.assertTrue(refresh_started.wait(timeout=5))
+        callers[1].start()
+        callers[1].join(timeout=0.2)
+        self.assertTrue(callers[1].is_alive())
+
+        finish_refresh.set()
+        for caller in callers:
+            caller.join(timeout=5)
+        self.assertEqual(results, [new, new])
+        new.refresh.assert_called_once()
+
+    def test_get_credentials_doesnt_reload_from_unchecked_file(self):
+        """Tests that a caller that skipped the file check can't reload."""
+        self._patch_credentials_file()
+        default = self._patch_default(mock.Mock(valid=True, expiry=None))
+        client._get_credentials()
+        reloaded = mock.Mock(valid=True, expiry=None)
+        new_mtime_ns = client._credentials_file_mtime_ns + 1_000_000
+        real_time = time.time
+
+        def reload_then_time():
+            # Simulates another thread reloading the changed file after this
+            # caller skipped the file check.
+            client._CREDENTIALS = reloaded
+            client._credentials_file_mtime_ns = new_mtime_ns
+            return real_time()
+
+        with mock.patch.object(
+            client.time, "time", side_effect=reload_then_time
+        ):
+            client._get_credentials()
+
+        default.assert_called_once()
+        self.assertIs(client._CREDENTIALS, reloaded)
+        self.assertEqual(client._credentials_file_mtime_ns, new_mtime_ns)
+
+    def test_get_client_closes_retired_clients_after_grace_period(self):
+        """Tests that clients dropped on reload are closed once unused."""
+        self._patch_default(mock.Mock(valid=True, expiry=None))
+        client_class = mock.Mock(side_effect=lambda **kwargs: mock.Mock())
+        self.addCleanup(client._CLIENTS.clear)
+        self.addCleanup(client._retired_clients.clear)
+        first = client._get_client(client_class)
+
+        with client._client_lock:
+            client._retire_clients([first])
+        client._get_client(client_class)
+        first.transport.close.assert_not_called()
+
+        with mock.patch.object(
+            client,
+            "time",
+            monotonic=mock.Mock(
+                return_value=time.monotonic()
+                + client._RETIRED_CLIENT_GRACE_SECONDS
+            ),
+            time=time.time,
+        ):
+            client._get_client(client_class)
+        first.transport.close.assert_called_once()
+        self.assertEqual(client._retired_clients, [])
+
+    def test_get_credentials_reloads_when_credentials_file_changes(self):
+        """Tests that credentials and clients are reloaded when the file changes."""
+        path = self._patch_credentials_file()
+        default = self._patch_default(mock.Mock(valid=True, expiry=None))
+        client_class = mock.Mock(side_effect=lambda **kwargs: mock.Mock())
+        self.addCleanup(client._CLIENTS.clear)
+
+        first = client._get_client(client_class)
+        self.assertIs(client._get_client(client_class), first)
+        default.assert_called_once()
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        # The change isn't noticed until the file is checked again.
+        self.assertIs(client._get_client(client_class), first)
+        default.assert_called_once()
+
+        client._credentials_file_check_after = 0.0
+        self.assertIsNot(client._get_client(client_class), first)
+        self.assertEqual(default.call_count, 2)
+
+        # The dropped client's channel is closed along with the shared ones.
+        client.close_clients()
+        first.transport.close.assert_called_once()
@@ -0,0 +1,102 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the core reporting module."""
+
+import threading
+import time
+import unittest
+from unittest import mock
+
+from google.analytics import data_v1beta
+
+from analytics_mcp.tools.reporting import core
+
+
+class TestRunReportMulti(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the `run_report_multi` tool."""
+
+    def setUp(self):
+        super().setUp()
+        self.client = mock.Mock()
+        self.client.run_report.side_effect = self._run_report
+        patcher = mock.patch.object(
+            core, "create_data_api_client", return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _run_report(self, request):
+        """Returns a response whose row count is the request's property ID."""
+        return data_v1beta.RunReportResponse(
+            row_count=int(request.property.split("/")[1])
+        )
+
+    async def _run_report_multi(self, property_ids):
+        return await core.run_report_multi(
+            property_ids,
+            [{"start_date": "yesterday", "end_date": "today"}],
+            ["country"],
+            ["activeUsers"],
+        )
+
+    async def test_run_report_multi_keys_reports_by_resource_name(self):
+        """Tests that reports are keyed by property resource name."""
+        results = await self._run_report_multi([1, "properties/2", "2"])
+
+        self.assertEqual(list(results), ["properties/1", "properties/2"])
+        self.assertEqual(results["properties/1"]["row_count"], 1)
+        self.assertEqual(results["properties/2"]["row_count"], 2)
+        self.assertEqual(self.client.run_report.call_count, 2)
+
+    async def test_run_report_multi_reports_errors_per_property(self):
+        """Tests that a failed report doesn't discard the other reports."""
+
+        def run_report(request):
+            if request.property == "properties/2":
+                raise PermissionError("No access to property")
+            return self._run_report(request)
+
+        self.client.run_report.side_effect = run_report
+
+        results = await self._run_report_multi([1, 2])
+
+        self.assertEqual(results["properties/1"]["row_count"], 1)
+        self.assertEqual(
+            results["properties/2"], {"error": "No access to property"}
+        )
+
+    async def test_run_report_multi_limits_concurrent_reports(self):
+        """Tests that no more than the maximum reports run at once."""
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def run_report(request):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+            return self._run_report(request)
+
+        self.client.run_report.side_effect = run_report
+
+        with mock.patch.object(core, "_MAX_CONCURRENT_REPORTS", 2):
+            results = await self._run_report_multi(range(1, 11))
+
+        self.assertEqual(len(results), 10)
+        self.assertLessEqual(max_in_flight, 2)
@@ -0,0 +1,100 @@
+# Copyright 2025 Google LLC All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Test cases for the realtime module."""
+
+import unittest
+from unittest import mock
+
+from google.analytics import data_v1beta
+
+from analytics_mcp.tools.reporting import realtime
+
+
+class TestRealtime(unittest.IsolatedAsyncioTestCase):
+    """Test cases for the realtime module."""
+
+    def setUp(self):
+        super().setUp()
+        realtime._realtime_cache.clear()
+        self.addCleanup(realtime._realtime_cache.clear)
+        self.client = mock.Mock()
+        self.client.run_realtime_report.return_value = (
+            data_v1beta.RunRealtimeReportResponse(row_count=1)
+        )
+        patcher = mock.patch.object(
+            realtime, "create_data_api_client", return_value=self.client
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_run_realtime_report_caches_identical_reports(self):
+        """Tests that an identical report within the TTL isn't rerun."""
+        first = await realtime.run_realtime_report(
+            123, ["country"], ["activeUsers"]
+        )
+        second = await realtime.run_realtime_report(
+            "properties/123", ["country"], ["activeUsers"]
+        )
+
+        self.assertEqual(first, second)
+        self.client.run_realtime_report.assert_called_once()
+
+        # Each caller gets its own copy of the cached result.
+        self.assertIsNot(first, second)
+        first["row_count"] = 2
+        third = await realtime.run_realtime_report(
+            123, ["country"], ["activeUsers"]
+        )
+        self.assertEqual(third, second)
+
+        await realtime.run_realtime_report(123, ["city"], ["activeUsers"])
+        self.assertEqual(self.client.run_realtime_report.call_count, 2)
+
+    async def test_run_realtime_report_reruns_expired_reports(self):
+        """Tests that a report is rerun once its cached result expires."""
+        with mock.patch.object(realtime, "time") as time:
+            time.monotonic.return_value = 0.0
+            await realtime.run_realtime_report(
+                123, ["country"], ["activeUsers"]
+            )
+            time.monotonic.return_value = realtime._REALTIME_CACHE_TTL_SECONDS
+            await realtime.run_realtime_report(
+                123, ["country"], ["activeUsers"]
+            )
+
+        self.assertEqual(self.client.run_realtime_report.call_count, 2)
+
+    async def test_run_realtime_report_doesnt_cache_property_quota(self):
+        """Tests that reports returning the property quota are always rerun."""
+        for _ in range(2):
+            await realtime.run_realtime_report(
+                123, ["country"], ["activeUsers"], return_property_quota=True
+            )
+
+        self.assertEqual(self.client.run_realtime_report.call_count, 2)
+        self.assertEqual(realtime._realtime_cache, {})
+
+    def test_cache_realtime_result_evicts_oldest_when_full(self):
+        """Tests that the oldest result is evicted once the cache is full."""
+        for i in range(realtime._REALTIME_CACHE_MAX_SIZE + 1):
+            realtime._cache_realtime_result(
+                str(i).encode(), data_v1beta.RunRealtimeReportResponse(), 0.0
+            )
+
+        self.assertEqual(
+            len(realtime._realtime_cache), realtime._REALTIME_CACHE_MAX_SIZE
+        )
+        self.assertNotIn(b"0", realtime._realtime_cache)
+        self.assertIn(b"1", realtime._realtime_cache)
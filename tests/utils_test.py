@@ -68,3 +68,22 @@ class TestUtils(unittest.TestCase):
             msg="Resource name with more than 2 components should fail",
         ):
             utils.construct_property_rn("properties/123/abc")
+        with self.assertRaises(ValueError, msg="Unhashable input should fail"):
+            utils.construct_property_rn(["properties/12345"])
+
+    def test_construct_property_rn_cached(self):
+        """Tests that repeated calls to construct_property_rn are cached."""
+        utils._construct_property_rn.cache_clear()
+        first = utils.construct_property_rn("properties/12345")
+        second = utils.construct_property_rn("properties/12345")
+        self.assertIs(first, second)
+        self.assertEqual(utils._construct_property_rn.cache_info().hits, 1)
+
+    def test_construct_dimension_and_metric_shared(self):
+        """Tests that dimensions and metrics are shared across calls."""
+        dimension = utils.construct_dimension("country")
+        metric = utils.construct_metric("activeUsers")
+        self.assertEqual(dimension.name, "country")
+        self.assertEqual(metric.name, "activeUsers")
+        self.assertIs(utils.construct_dimension("country"), dimension)
+        self.assertIs(utils.construct_metric("activeUsers"), metric)